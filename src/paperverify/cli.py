@@ -9,7 +9,7 @@ from rich.console import Console
 from . import __version__
 from .parser import parse_latex
 from .matcher import load_results
-from .validator import verify_paper
+from .validator import MatchStatus, verify_paper
 from .reporter import Reporter
 
 
@@ -63,7 +63,7 @@ def check(
     # Load results
     console.print(f"📊 Loading results from [cyan]{results}[/cyan]...")
     matcher = load_results(results)
-    console.print(f"   Loaded [bold]{len(matcher.values)}[/bold] result values")
+    console.print(f"   Loaded [bold]{len(matcher)}[/bold] result values")
     
     # Verify
     console.print(f"🔍 Verifying claims (tolerance: {tolerance}%)...")
@@ -79,8 +79,7 @@ def check(
         console.print(f"\n📝 Report saved to [cyan]{report}[/cyan]")
     
     # Exit code based on mismatches
-    mismatches = sum(1 for r in verification_results if r.status.value == "mismatch")
-    if mismatches > 0:
+    if any(r.status == MatchStatus.MISMATCH for r in verification_results):
         raise typer.Exit(code=1)
 
 
@@ -1,18 +1,65 @@
 """Result file matcher to load and index experiment results."""
 
+import csv
 import json
+import os
+import re
+import sys
+from collections import deque
+from contextlib import closing
+from functools import cached_property, lru_cache
+from itertools import chain
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-import csv
+from typing import (
+    Any, BinaryIO, Deque, Dict, Iterable, Iterator, List, Optional,
+    Sequence, Tuple,
+)
 import sqlite3
 import pickle
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # optional, faster JSON parsing
+    orjson = None
+
+# Format support libraries (openpyxl, python-docx, PyYAML, pdfplumber,
+# ijson) are imported inside their loaders so that only the formats
+# actually present in a results directory pay the import cost.
+
+# Metric names looked for in key paths and column names, in priority order
+_METRIC_NAMES = ('mae', 'rmse', 'smape', 'latency', 'vram')
+
+
+def _loads_json(raw: bytes) -> Any:
+    """Parse JSON bytes, with orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson rejects some input the json module accepts, such as
+            # NaN/Infinity and integers wider than 64 bits
+            pass
+    return json.loads(raw)
+
 
-# All format support libraries (built-in dependencies)
-import openpyxl
-from docx import Document
-import yaml
-import tabula
+@lru_cache(maxsize=None)
+def _file_stem(source_file: str) -> str:
+    """Return Path(source_file).stem, computed once per file."""
+    return sys.intern(Path(source_file).stem)
+
+
+@lru_cache(maxsize=None)
+def _lower(name: str) -> str:
+    """Return name.lower(), computed and interned once per distinct name."""
+    return sys.intern(name.lower())
+
+
+# (source_file, path, model, dataset, metric) of a stored value
+_ValueMeta = Tuple[str, str, Optional[str], Optional[str], Optional[str]]
 
 
 @dataclass
@@ -25,6 +72,28 @@ class ResultValue:
     model: Optional[str] = None
     dataset: Optional[str] = None
     metric: Optional[str] = None
+    
+    # Matching keys are computed on first use, so only values that are
+    # scored as candidates pay for them
+    @cached_property
+    def metric_lower(self) -> Optional[str]:
+        """Lowercased metric name, interned across values."""
+        return _lower(self.metric) if self.metric else None
+    
+    @cached_property
+    def model_lower(self) -> Optional[str]:
+        """Lowercased model name, interned across values."""
+        return _lower(self.model) if self.model else None
+    
+    @cached_property
+    def path_lower(self) -> str:
+        """Lowercased path; paths are mostly unique, so computed on demand."""
+        return self.path.lower()
+    
+    @property
+    def source_stem(self) -> str:
+        """Name of the source file without its suffix."""
+        return _file_stem(self.source_file)
 
 
 class ResultMatcher:
@@ -45,163 +114,346 @@ class ResultMatcher:
         'pickle': True,
     }
     
+    # JSON files at least this large are streamed with ijson. Streaming
+    # bounds memory but is several times slower than parsing in one go
+    # (every item of a long list goes through Python), so only files too
+    # big to comfortably hold in memory are streamed.
+    STREAM_JSON_BYTES = 64 * 1024 * 1024
+    
+    # pdfplumber settings for tables without ruled cell borders
+    PDF_TEXT_TABLE_SETTINGS = {
+        'vertical_strategy': 'text',
+        'horizontal_strategy': 'text',
+    }
+    
+    # find_positions_batch checks targets whose windows hold at most
+    # BATCH_WINDOW_VALUES candidates in one vectorized pass, at most
+    # MAX_BATCH_CANDIDATES values at a time so the scratch arrays stay small
+    # (~8 MB each); wider windows are faster searched one by one
+    BATCH_WINDOW_VALUES = 512
+    MAX_BATCH_CANDIDATES = 1 << 20
+    
+    # Worker threads used by load_directory
+    MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+    
     def __init__(self):
-        self.values: List[ResultValue] = []
-        self.index: Dict[float, List[ResultValue]] = {}
+        # Values are stored column-wise: a float64 array of the numbers plus
+        # one metadata tuple per value. ResultValue objects are only built for
+        # values handed back to callers.
+        self._values = np.empty(0, dtype=np.float64)
+        self._meta: List[_ValueMeta] = []
+        # round(value, 6) of every value, the key for exact lookup
+        self._keys = np.empty(0, dtype=np.float64)
+        # Batches of values and keys added since the arrays were built
+        self._pending: List[Tuple[np.ndarray, np.ndarray]] = []
+        # Sorted copies of the values and keys for searching, rebuilt lazily
+        self._sorted_values: Optional[np.ndarray] = None
+        self._sort_idx: Optional[np.ndarray] = None
+        self._sorted_keys: Optional[np.ndarray] = None
+        self._key_idx: Optional[np.ndarray] = None
     
     def load_directory(self, dirpath: Path) -> int:
         """Load all result files from a directory."""
         dirpath = Path(dirpath)
         count = 0
         
-        # Load JSON files
-        for json_file in dirpath.rglob('*.json'):
-            try:
-                self._load_json_file(json_file)
-                count += 1
-            except Exception as e:
-                print(f"Warning: Could not load {json_file}: {e}")
-        
-        # Load CSV files
-        for csv_file in dirpath.rglob('*.csv'):
-            try:
-                self._load_csv_file(csv_file)
-                count += 1
-            except Exception as e:
-                print(f"Warning: Could not load {csv_file}: {e}")
-        
-        # Load Excel files
-        for xlsx_file in dirpath.rglob('*.xlsx'):
-            try:
-                self._load_excel_file(xlsx_file)
-                count += 1
-            except Exception as e:
-                print(f"Warning: Could not load {xlsx_file}: {e}")
-        for xls_file in dirpath.rglob('*.xls'):
-            try:
-                self._load_excel_file(xls_file)
-                count += 1
-            except Exception as e:
-                print(f"Warning: Could not load {xls_file}: {e}")
-        
-        # Load Word files
-        for docx_file in dirpath.rglob('*.docx'):
-            try:
-                self._load_word_file(docx_file)
-                count += 1
-            except Exception as e:
-                print(f"Warning: Could not load {docx_file}: {e}")
-        
-        # Load YAML files
-        for yaml_file in dirpath.rglob('*.yaml'):
-            try:
-                self._load_yaml_file(yaml_file)
-                count += 1
-            except Exception as e:
-                print(f"Warning: Could not load {yaml_file}: {e}")
-        for yml_file in dirpath.rglob('*.yml'):
-            try:
-                self._load_yaml_file(yml_file)
-                count += 1
-            except Exception as e:
-                print(f"Warning: Could not load {yml_file}: {e}")
-        
-        # Load SQLite files
-        for db_file in dirpath.rglob('*.sqlite'):
-            try:
-                self._load_sqlite_file(db_file)
-                count += 1
-            except Exception as e:
-                print(f"Warning: Could not load {db_file}: {e}")
-        for db_file in dirpath.rglob('*.db'):
-            try:
-                self._load_sqlite_file(db_file)
-                count += 1
-            except Exception as e:
-                print(f"Warning: Could not load {db_file}: {e}")
-        
-        # Load PDF files (tables only)
-        for pdf_file in dirpath.rglob('*.pdf'):
-            try:
-                self._load_pdf_file(pdf_file)
-                count += 1
-            except Exception as e:
-                print(f"Warning: Could not load {pdf_file}: {e}")
-        
-        # Load Pickle files
-        for pkl_file in dirpath.rglob('*.pkl'):
-            try:
-                self._load_pickle_file(pkl_file)
-                count += 1
-            except Exception as e:
-                print(f"Warning: Could not load {pkl_file}: {e}")
-        for pickle_file in dirpath.rglob('*.pickle'):
-            try:
-                self._load_pickle_file(pickle_file)
-                count += 1
-            except Exception as e:
-                print(f"Warning: Could not load {pickle_file}: {e}")
-        
-        # Build index
-        self._build_index()
+        # Loaders in load order; the suffix decides which one handles a file
+        loaders = {
+            '.json': self._load_json_file,
+            '.csv': self._load_csv_file,
+            '.xlsx': self._load_excel_file,
+            '.xls': self._load_excel_file,
+            '.docx': self._load_word_file,
+            '.yaml': self._load_yaml_file,
+            '.yml': self._load_yaml_file,
+            '.sqlite': self._load_sqlite_file,
+            '.db': self._load_sqlite_file,
+            '.pdf': self._load_pdf_file,
+            '.pkl': self._load_pickle_file,
+            '.pickle': self._load_pickle_file,
+        }
+        
+        # Walk the tree once and bucket files by suffix
+        found: Dict[str, List[Path]] = {ext: [] for ext in loaders}
+        for filepath, ext in self._iter_files(dirpath):
+            if ext in found:
+                found[ext].append(filepath)
+        
+        # Files are independent and mostly I/O-bound, so load them
+        # concurrently but merge the results in the order above. Only a
+        # bounded window of files is in flight, and each file's values are
+        # released once merged, so peak memory does not grow with the tree.
+        pending = (
+            (filepath, loader)
+            for ext, loader in loaders.items()
+            for filepath in found[ext]
+        )
+        window = self.MAX_WORKERS * 2
+        jobs: Deque[Tuple[Path, Future]] = deque()
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            for filepath, loader in pending:
+                jobs.append((filepath, executor.submit(loader, filepath)))
+                if len(jobs) >= window:
+                    count += self._merge_loaded(*jobs.popleft())
+            while jobs:
+                count += self._merge_loaded(*jobs.popleft())
         
         return count
     
-    def _load_json_file(self, filepath: Path):
-        """Load values from a JSON file."""
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+    def __len__(self) -> int:
+        return len(self._meta)
+    
+    @property
+    def values(self) -> Tuple[ResultValue, ...]:
+        """All loaded values, built as ResultValue objects on each access.
+        
+        A tuple, since changing it would not change the matcher; add values
+        with add_values. Every access builds all of the objects again, so
+        take it once rather than indexing it in a loop.
+        """
+        return tuple(self.values_at(np.arange(len(self))))
+    
+    def _add(self, rv: ResultValue):
+        """Store a value and index it for exact lookup."""
+        self.add_values([rv])
+    
+    def add_values(self, values: Iterable[ResultValue]):
+        """Store and index a batch of values, such as one file's contents.
+        
+        Adding in batches is cheaper than adding one value at a time; the
+        value array and its sorted view are rebuilt once, on the next search.
+        """
+        values = list(values)
+        numbers = [rv.value for rv in values]
+        # Python's round, so keys match round(target, 6) exactly
+        keys = [round(number, 6) for number in numbers]
         
+        # The arrays are only rebuilt once, when they are next read
+        self._pending.append((
+            np.array(numbers, dtype=np.float64),
+            np.array(keys, dtype=np.float64),
+        ))
+        self._meta.extend([
+            (rv.source_file, rv.path, rv.model, rv.dataset, rv.metric)
+            for rv in values
+        ])
+        self._sorted_values = None
+        self._sorted_keys = None
+    
+    def _column(self) -> np.ndarray:
+        """Return all values as one float64 array."""
+        if self._pending:
+            numbers, keys = zip(*self._pending)
+            self._values = np.concatenate((self._values,) + numbers)
+            self._keys = np.concatenate((self._keys,) + keys)
+            self._pending = []
+        return self._values
+    
+    def _make_value(self, i: int) -> ResultValue:
+        """Build the ResultValue stored at position i."""
+        source_file, path, model, dataset, metric = self._meta[i]
+        return ResultValue(
+            value=float(self._column()[i]),
+            source_file=source_file,
+            path=path,
+            model=model,
+            dataset=dataset,
+            metric=metric,
+        )
+    
+    def _sorted_view(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the values in ascending order and their positions."""
+        if self._sorted_values is None:
+            raw = self._column()
+            self._sort_idx = np.argsort(raw, kind='stable')
+            self._sorted_values = raw[self._sort_idx]
+        return self._sorted_values, self._sort_idx
+    
+    def _exact_positions(self, target: float) -> np.ndarray:
+        """Return the positions of values with round(value, 6) == round(target, 6)."""
+        key = round(target, 6)
+        if key != key or not len(self):  # NaN equals nothing
+            return np.empty(0, dtype=np.intp)
+        
+        if self._sorted_keys is None:
+            self._column()
+            # Stable, so equal keys stay in insertion order
+            self._key_idx = np.argsort(self._keys, kind='stable')
+            self._sorted_keys = self._keys[self._key_idx]
+        start = np.searchsorted(self._sorted_keys, key, side='left')
+        stop = np.searchsorted(self._sorted_keys, key, side='right')
+        return self._key_idx[start:stop]
+    
+    def _merge_loaded(self, filepath: Path, job: Future) -> int:
+        """Add the values of a finished load job; return 1 if it loaded."""
+        try:
+            file_values = job.result()
+        except Exception as e:
+            print(f"Warning: Could not load {filepath}: {e}")
+            return 0
+        self.add_values(file_values)
+        return 1
+    
+    @staticmethod
+    def _iter_files(dirpath: Path) -> Iterator[Tuple[Path, str]]:
+        """Yield (path, lowercase suffix) for every file below dirpath."""
+        for root, _dirs, files in os.walk(dirpath):
+            for name in files:
+                yield Path(root, name), os.path.splitext(name)[1].lower()
+    
+    def _load_json_file(self, filepath: Path) -> List[ResultValue]:
+        """Load values from a JSON file."""
         filename = filepath.stem
         model, dataset = self._parse_filename(filename)
-        self._extract_from_dict(data, str(filepath), '', model, dataset)
+        
+        # Stream large files instead of materializing the whole tree
+        if filepath.stat().st_size >= self.STREAM_JSON_BYTES:
+            import ijson
+            
+            with open(filepath, 'rb') as f:
+                try:
+                    return self._stream_json(f, str(filepath), model, dataset)
+                except ijson.JSONError:
+                    # ijson rejects NaN/Infinity and integers wider than 64
+                    # bits, which json accepts; parse the whole file instead
+                    pass
+        
+        with open(filepath, 'rb') as f:
+            data = _loads_json(f.read())
+        
+        values: List[ResultValue] = []
+        self._extract_from_dict(data, str(filepath), '', model, dataset, values)
+        return values
+    
+    def _stream_json(
+        self,
+        f: BinaryIO,
+        source_file: str,
+        model: Optional[str],
+        dataset: Optional[str],
+    ) -> List[ResultValue]:
+        """Extract numeric values from a JSON stream, like _extract_from_dict."""
+        import ijson
+        
+        values: List[ResultValue] = []
+        # Open containers as [is_array, path, current key path or item count]
+        containers: List[list] = []
+        # Values collected per open array; None once an array has grown past
+        # 100 items, since _extract_from_dict skips such lists entirely
+        buffers: List[Optional[List[ResultValue]]] = [values]
+        
+        for _prefix, event, value in ijson.parse(f, use_float=True):
+            if event == 'map_key':
+                frame = containers[-1]
+                frame[2] = f"{frame[1]}.{value}" if frame[1] else value
+                continue
+            if event == 'end_map':
+                containers.pop()
+                continue
+            if event == 'end_array':
+                containers.pop()
+                items = buffers.pop()
+                if items is not None and buffers[-1] is not None:
+                    buffers[-1].extend(items)
+                continue
+            
+            # Anything else is a value or the start of a container
+            if not containers:
+                path = ''
+            elif containers[-1][0]:
+                frame = containers[-1]
+                path = f"{frame[1]}[{frame[2]}]"
+                frame[2] += 1
+                if frame[2] > 100:
+                    buffers[-1] = None
+            else:
+                path = containers[-1][2]
+            
+            if event == 'start_map':
+                containers.append([False, path, None])
+            elif event == 'start_array':
+                containers.append([True, path, 0])
+                buffers.append([] if buffers[-1] is not None else None)
+            elif event in ('number', 'boolean') and buffers[-1] is not None:
+                buffers[-1].append(ResultValue(
+                    value=float(value),
+                    source_file=source_file,
+                    path=path,
+                    model=model,
+                    dataset=dataset,
+                    metric=self._guess_metric(path),
+                ))
+        
+        return values
     
-    def _load_csv_file(self, filepath: Path):
+    def _load_csv_file(self, filepath: Path) -> List[ResultValue]:
         """Load values from a CSV file."""
+        source_file = str(filepath)
+        metrics: Dict[Any, Optional[str]] = {}
+        
+        values: List[ResultValue] = []
         with open(filepath, 'r', encoding='utf-8') as f:
             reader = csv.DictReader(f)
             for row_num, row in enumerate(reader):
                 for col, val in row.items():
                     try:
                         numeric_val = float(val)
-                        self.values.append(ResultValue(
-                            value=numeric_val,
-                            source_file=str(filepath),
-                            path=f"row_{row_num}.{col}",
-                            metric=self._guess_metric(col),
-                        ))
                     except (ValueError, TypeError):
                         continue
+                    # Guess each column's metric once, not once per row
+                    if col not in metrics:
+                        metrics[col] = self._guess_metric(col)
+                    values.append(ResultValue(
+                        value=numeric_val,
+                        source_file=source_file,
+                        path=f"row_{row_num}.{col}",
+                        metric=metrics[col],
+                    ))
+        return values
     
-    def _load_excel_file(self, filepath: Path):
+    def _load_excel_file(self, filepath: Path) -> List[ResultValue]:
         """Load values from an Excel file."""
-        wb = openpyxl.load_workbook(filepath, data_only=True)
-        
-        for sheet_name in wb.sheetnames:
-            sheet = wb[sheet_name]
-            for row_idx, row in enumerate(sheet.iter_rows(values_only=True)):
-                for col_idx, cell in enumerate(row):
-                    if isinstance(cell, (int, float)) and cell is not None:
-                        self.values.append(ResultValue(
-                            value=float(cell),
-                            source_file=str(filepath),
-                            path=f"{sheet_name}.row{row_idx}.col{col_idx}",
-                            metric=None,
-                        ))
+        import openpyxl
+        
+        # Read-only mode streams rows instead of building every cell object
+        wb = openpyxl.load_workbook(filepath, data_only=True, read_only=True)
+        
+        values: List[ResultValue] = []
+        try:
+            for sheet_name in wb.sheetnames:
+                sheet = wb[sheet_name]
+                for row_idx, row in enumerate(sheet.iter_rows(values_only=True)):
+                    for col_idx, cell in enumerate(row):
+                        # Exact type check: booleans are ints but not results
+                        if type(cell) in (int, float):
+                            values.append(ResultValue(
+                                value=float(cell),
+                                source_file=str(filepath),
+                                path=f"{sheet_name}.row{row_idx}.col{col_idx}",
+                                metric=None,
+                            ))
+        finally:
+            # Read-only workbooks keep the file open until closed
+            wb.close()
+        return values
     
-    def _load_word_file(self, filepath: Path):
+    def _load_word_file(self, filepath: Path) -> List[ResultValue]:
         """Load numeric values from a Word document (tables and text)."""
-        import re
+        from docx import Document
+        
         doc = Document(filepath)
+        values: List[ResultValue] = []
         
         # Extract from tables
         for table_idx, table in enumerate(doc.tables):
             for row_idx, row in enumerate(table.rows):
                 for col_idx, cell in enumerate(row.cells):
                     text = cell.text.strip()
+                    if ',' in text:
+                        text = text.replace(',', '')
                     try:
-                        numeric_val = float(text.replace(',', ''))
-                        self.values.append(ResultValue(
+                        numeric_val = float(text)
+                        values.append(ResultValue(
                             value=numeric_val,
                             source_file=str(filepath),
                             path=f"table{table_idx}.row{row_idx}.col{col_idx}",
@@ -214,10 +466,13 @@ class ResultMatcher:
         number_pattern = re.compile(r'[\d,]+\.?\d*')
         for para_idx, para in enumerate(doc.paragraphs):
             for match in number_pattern.finditer(para.text):
+                text = match.group()
+                if ',' in text:
+                    text = text.replace(',', '')
                 try:
-                    numeric_val = float(match.group().replace(',', ''))
+                    numeric_val = float(text)
                     if numeric_val != 0:
-                        self.values.append(ResultValue(
+                        values.append(ResultValue(
                             value=numeric_val,
                             source_file=str(filepath),
                             path=f"para{para_idx}",
@@ -225,86 +480,151 @@ class ResultMatcher:
                         ))
                 except ValueError:
                     pass
+        return values
     
-    def _load_yaml_file(self, filepath: Path):
+    def _load_yaml_file(self, filepath: Path) -> List[ResultValue]:
         """Load values from a YAML file."""
+        import yaml
+        
         with open(filepath, 'r', encoding='utf-8') as f:
             data = yaml.safe_load(f)
         
+        values: List[ResultValue] = []
         if data:
             filename = filepath.stem
             model, dataset = self._parse_filename(filename)
-            self._extract_from_dict(data, str(filepath), '', model, dataset)
+            self._extract_from_dict(data, str(filepath), '', model, dataset, values)
+        return values
     
-    def _load_sqlite_file(self, filepath: Path):
+    def _load_sqlite_file(self, filepath: Path) -> List[ResultValue]:
         """Load numeric values from SQLite database."""
-        conn = sqlite3.connect(filepath)
-        cursor = conn.cursor()
-        
-        # Get all tables
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-        tables = cursor.fetchall()
-        
-        for (table_name,) in tables:
-            try:
-                cursor.execute(f"SELECT * FROM {table_name}")
-                columns = [desc[0] for desc in cursor.description]
-                
-                for row_idx, row in enumerate(cursor.fetchall()):
-                    for col_idx, (col_name, value) in enumerate(zip(columns, row)):
-                        if isinstance(value, (int, float)) and value is not None:
-                            self.values.append(ResultValue(
-                                value=float(value),
-                                source_file=str(filepath),
-                                path=f"{table_name}.{col_name}.row{row_idx}",
-                                metric=self._guess_metric(col_name),
-                            ))
-            except Exception:
-                continue
+        values: List[ResultValue] = []
+        
+        with closing(sqlite3.connect(filepath)) as conn:
+            # Get all tables
+            tables = conn.execute(
+                "SELECT name FROM sqlite_master WHERE type='table'"
+            ).fetchall()
+            
+            for (table_name,) in tables:
+                try:
+                    quoted = self._quote_sql_name(table_name)
+                    # Columns with TEXT affinity store numbers as text, so only
+                    # the others can hold results; let SQLite skip the rest
+                    columns = [
+                        name
+                        for _cid, name, decl_type, *_ in conn.execute(
+                            f"PRAGMA table_info({quoted})"
+                        )
+                        if not self._has_text_affinity(decl_type)
+                    ]
+                    if not columns:
+                        continue
+                    
+                    metrics = [self._guess_metric(col) for col in columns]
+                    cursor = conn.execute(
+                        f"SELECT {', '.join(map(self._quote_sql_name, columns))} "
+                        f"FROM {quoted}"
+                    )
+                    
+                    # Fetch in batches rather than all rows at once
+                    batches = iter(lambda: cursor.fetchmany(10000), [])
+                    for row_idx, row in enumerate(chain.from_iterable(batches)):
+                        for col_name, metric, value in zip(columns, metrics, row):
+                            if type(value) in (int, float):
+                                values.append(ResultValue(
+                                    value=float(value),
+                                    source_file=str(filepath),
+                                    path=f"{table_name}.{col_name}.row{row_idx}",
+                                    metric=metric,
+                                ))
+                except Exception:
+                    continue
         
-        conn.close()
+        return values
+    
+    @staticmethod
+    def _quote_sql_name(name: str) -> str:
+        """Quote a SQLite identifier."""
+        return '"' + name.replace('"', '""') + '"'
     
-    def _load_pdf_file(self, filepath: Path):
-        """Load numeric values from PDF tables using tabula-py."""
-        # Extract all tables from PDF
-        tables = tabula.read_pdf(str(filepath), pages='all', silent=True)
+    @staticmethod
+    def _has_text_affinity(decl_type: str) -> bool:
+        """Apply SQLite's column affinity rules for TEXT."""
+        decl_type = decl_type.upper()
+        if 'INT' in decl_type:
+            return False
+        return any(t in decl_type for t in ('CHAR', 'CLOB', 'TEXT'))
+    
+    def _load_pdf_file(self, filepath: Path) -> List[ResultValue]:
+        """Load numeric values from PDF tables using pdfplumber."""
+        import pdfplumber
+        
+        # Extract all tables from PDF. The default strategy needs ruled cell
+        # borders; pages without any such table are read again by text
+        # alignment, which finds booktabs-style and whitespace-only tables.
+        tables = []
+        with pdfplumber.open(filepath) as pdf:
+            for page in pdf.pages:
+                tables.extend(
+                    page.extract_tables()
+                    or page.extract_tables(self.PDF_TEXT_TABLE_SETTINGS)
+                )
         
-        for table_idx, df in enumerate(tables):
-            for row_idx in range(len(df)):
-                for col_idx, col_name in enumerate(df.columns):
-                    val = df.iloc[row_idx, col_idx]
+        values: List[ResultValue] = []
+        for table_idx, table in enumerate(tables):
+            if not table:
+                continue
+            
+            # The first row holds the column headers; rows without any text
+            # (spacing picked up by the text strategy) are dropped
+            header = table[0]
+            rows = [row for row in table[1:] if any(row)]
+            columns = [
+                cell or f"Unnamed: {col_idx}" for col_idx, cell in enumerate(header)
+            ]
+            metrics = [self._guess_metric(col) for col in columns]
+            
+            for row_idx, row in enumerate(rows):
+                for col_name, metric, val in zip(columns, metrics, row):
+                    if not val:
+                        continue
+                    # Handle string numbers with commas
+                    val = val.strip()
+                    if ',' in val:
+                        val = val.replace(',', '')
                     try:
-                        # Handle string numbers with commas
-                        if isinstance(val, str):
-                            val = val.replace(',', '')
                         numeric_val = float(val)
-                        if numeric_val != 0:
-                            self.values.append(ResultValue(
-                                value=numeric_val,
-                                source_file=str(filepath),
-                                path=f"table{table_idx}.{col_name}.row{row_idx}",
-                                metric=self._guess_metric(str(col_name)),
-                            ))
-                    except (ValueError, TypeError):
+                    except ValueError:
                         continue
+                    if numeric_val != 0:
+                        values.append(ResultValue(
+                            value=numeric_val,
+                            source_file=str(filepath),
+                            path=f"table{table_idx}.{col_name}.row{row_idx}",
+                            metric=metric,
+                        ))
+        return values
     
-    def _load_pickle_file(self, filepath: Path):
+    def _load_pickle_file(self, filepath: Path) -> List[ResultValue]:
         """Load numeric values from a Pickle file (DataFrame or dict)."""
         with open(filepath, 'rb') as f:
             data = pickle.load(f)
         
+        values: List[ResultValue] = []
         # Handle pandas DataFrame
         if hasattr(data, 'iterrows'):  # Duck typing for DataFrame
+            metrics = [self._guess_metric(str(col)) for col in data.columns]
             for row_idx, row in data.iterrows():
-                for col_name in data.columns:
+                for col_name, metric in zip(data.columns, metrics):
                     val = row[col_name]
                     try:
                         numeric_val = float(val)
-                        self.values.append(ResultValue(
+                        values.append(ResultValue(
                             value=numeric_val,
                             source_file=str(filepath),
                             path=f"{col_name}.row{row_idx}",
-                            metric=self._guess_metric(str(col_name)),
+                            metric=metric,
                         ))
                     except (ValueError, TypeError):
                         continue
@@ -312,15 +632,16 @@ class ResultMatcher:
         elif isinstance(data, (dict, list)):
             filename = filepath.stem
             model, dataset = self._parse_filename(filename)
-            self._extract_from_dict(data, str(filepath), '', model, dataset)
+            self._extract_from_dict(data, str(filepath), '', model, dataset, values)
         # Handle single numeric value
         elif isinstance(data, (int, float)):
-            self.values.append(ResultValue(
+            values.append(ResultValue(
                 value=float(data),
                 source_file=str(filepath),
                 path='value',
                 metric=None,
             ))
+        return values
     
     def _extract_from_dict(
         self, 
@@ -328,30 +649,42 @@ class ResultMatcher:
         source_file: str, 
         path: str,
         model: Optional[str],
-        dataset: Optional[str]
+        dataset: Optional[str],
+        values: List[ResultValue],
     ):
-        """Recursively extract numeric values from a dictionary."""
-        if isinstance(data, dict):
-            for key, value in data.items():
-                new_path = f"{path}.{key}" if path else key
-                self._extract_from_dict(value, source_file, new_path, model, dataset)
-        elif isinstance(data, list):
-            if len(data) > 100:
-                return
-            for i, item in enumerate(data):
-                self._extract_from_dict(item, source_file, f"{path}[{i}]", model, dataset)
-        elif isinstance(data, (int, float)):
-            metric = self._guess_metric(path)
-            self.values.append(ResultValue(
-                value=float(data),
-                source_file=source_file,
-                path=path,
-                model=model,
-                dataset=dataset,
-                metric=metric,
-            ))
+        """Extract numeric values from nested dicts and lists into values."""
+        # An explicit stack keeps deeply nested data clear of the recursion
+        # limit; children are pushed in reverse so values keep document order
+        stack = [(data, path)]
+        while stack:
+            data, path = stack.pop()
+            if isinstance(data, dict):
+                stack.extend(reversed([
+                    (value, f"{path}.{key}" if path else key)
+                    for key, value in data.items()
+                ]))
+            elif isinstance(data, list):
+                if len(data) > 100:
+                    continue
+                stack.extend(reversed([
+                    (item, f"{path}[{i}]") for i, item in enumerate(data)
+                ]))
+            elif isinstance(data, (int, float)):
+                metric = self._guess_metric(path)
+                values.append(ResultValue(
+                    value=float(data),
+                    source_file=source_file,
+                    path=path,
+                    model=model,
+                    dataset=dataset,
+                    metric=metric,
+                ))
     
-    def _parse_filename(self, filename: str) -> tuple:
+    # Filenames and key paths repeat heavily across files and rows, so both
+    # lookups below are memoized
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _parse_filename(filename: str) -> tuple:
         """Extract model and dataset from filename like 'xgboost_etth1'."""
         parts = filename.lower().replace('-', '_').split('_')
         
@@ -369,55 +702,206 @@ class ResultMatcher:
         
         return model, dataset
     
-    def _guess_metric(self, path: str) -> Optional[str]:
+    @staticmethod
+    def _guess_metric(path: str) -> Optional[str]:
         """Guess the metric type from the JSON path."""
         path_lower = path.lower()
-        
-        if 'mae' in path_lower:
-            return 'mae'
-        elif 'rmse' in path_lower:
-            return 'rmse'
-        elif 'smape' in path_lower:
-            return 'smape'
-        elif 'latency' in path_lower:
-            return 'latency'
-        elif 'vram' in path_lower:
-            return 'vram'
-        
+        for metric in _METRIC_NAMES:
+            if metric in path_lower:
+                return metric
         return None
     
-    def _build_index(self):
-        """Build an index for fast lookup."""
-        self.index.clear()
-        for rv in self.values:
-            key = round(rv.value, 6)
-            if key not in self.index:
-                self.index[key] = []
-            self.index[key].append(rv)
-    
     def find_matches(
         self, 
         target: float, 
         tolerance_pct: float = 1.0
     ) -> List[ResultValue]:
-        """Find result values that match the target within tolerance."""
-        matches = []
+        """Find result values that match the target within tolerance.
         
-        for rv in self.values:
-            if rv.value == 0:
-                continue
-            
-            diff_pct = abs(rv.value - target) / abs(rv.value) * 100
-            
-            if diff_pct <= tolerance_pct:
-                matches.append(rv)
+        A tolerance of zero or less uses the exact-match index instead.
+        """
+        return self.values_at(self.find_positions(target, tolerance_pct))
+    
+    def find_matches_batch(
+        self,
+        targets: Sequence[float],
+        tolerance_pct: float = 1.0
+    ) -> List[List[ResultValue]]:
+        """Run find_matches for many targets with one vectorized search."""
+        return [
+            self.values_at(positions)
+            for positions in self.find_positions_batch(targets, tolerance_pct)
+        ]
+    
+    def find_positions(self, target: float, tolerance_pct: float = 1.0) -> np.ndarray:
+        """Return the positions of the values find_matches would return.
+        
+        Positions index value_array and values_at, so callers can inspect
+        the numbers before building any ResultValue.
+        """
+        if tolerance_pct <= 0:
+            return self._exact_positions(target)
+        if not len(self):
+            return np.empty(0, dtype=np.intp)
+        
+        # Only the sorted slice around the target can match
+        sorted_values, sort_idx = self._sorted_view()
+        starts, stops = self._windows(
+            np.array([target], dtype=np.float64), tolerance_pct
+        )
+        window = slice(int(starts[0]), int(stops[0]))
+        hits = self._within_tolerance(sorted_values[window], target, tolerance_pct)
+        
+        # Insertion order, as a full scan would return them
+        return np.sort(sort_idx[window][hits])
+    
+    def find_positions_batch(
+        self,
+        targets: Sequence[float],
+        tolerance_pct: float = 1.0
+    ) -> List[np.ndarray]:
+        """Run find_positions for many targets with one vectorized search."""
+        if tolerance_pct <= 0 or not len(self):
+            return [self.find_positions(target, tolerance_pct) for target in targets]
+        
+        targets = np.asarray(targets, dtype=np.float64)
+        starts, stops = self._windows(targets, tolerance_pct)
+        
+        counts = stops - starts
+        found: List[Optional[np.ndarray]] = [None] * len(targets)
+        
+        # Wide windows are searched one target at a time: past a few hundred
+        # candidates the flat layout's extra passes cost more than the
+        # per-call overhead it saves
+        wide = counts > self.BATCH_WINDOW_VALUES
+        for i in np.flatnonzero(wide).tolist():
+            found[i] = self.find_positions(float(targets[i]), tolerance_pct)
         
-        return matches
+        # Narrow windows are checked together, in runs holding at most
+        # MAX_BATCH_CANDIDATES values
+        narrow = np.flatnonzero(~wide)
+        ends = np.cumsum(counts[narrow])
+        first = 0
+        while first < len(narrow):
+            base = ends[first - 1] if first else 0
+            last = int(np.searchsorted(ends, base + self.MAX_BATCH_CANDIDATES, 'right'))
+            last = max(last, first + 1)
+            run = narrow[first:last]
+            for i, positions in zip(run.tolist(), self._search_windows(
+                targets[run], starts[run], stops[run], tolerance_pct
+            )):
+                found[i] = positions
+            first = last
+        return found
+    
+    def _search_windows(
+        self,
+        targets: np.ndarray,
+        starts: np.ndarray,
+        stops: np.ndarray,
+        tolerance_pct: float
+    ) -> List[np.ndarray]:
+        """Check the windows of several targets in one vectorized pass."""
+        sorted_values, sort_idx = self._sorted_view()
+        
+        # Lay every target's window out end to end in one flat array
+        counts = stops - starts
+        offsets = np.cumsum(counts) - counts
+        flat = np.arange(counts.sum()) + np.repeat(starts - offsets, counts)
+        owner = np.repeat(np.arange(len(targets)), counts)
+        values = sorted_values[flat]
+        
+        # Check all windows at once
+        hits = self._within_tolerance(values, targets[owner], tolerance_pct)
+        hit_owner = owner[hits]
+        hit_positions = sort_idx[flat[hits]]
+        
+        # Hits are already grouped by target; put each group in insertion
+        # order, as a full scan would return them, by sorting on one
+        # combined (target, position) key, then cut the groups apart
+        size = len(sorted_values)
+        keys = hit_owner * size
+        keys += hit_positions
+        keys.sort()
+        found = keys % size
+        ends = np.cumsum(np.bincount(hit_owner, minlength=len(targets))).tolist()
+        return [found[start:end] for start, end in zip([0] + ends, ends)]
+    
+    @property
+    def value_array(self) -> np.ndarray:
+        """All stored values as one float64 array, indexed by position."""
+        return self._column()
+    
+    def values_at(self, positions: np.ndarray) -> List[ResultValue]:
+        """Build the ResultValues stored at the given positions."""
+        make_value = self._make_value
+        return [make_value(i) for i in positions.tolist()]
+    
+    @staticmethod
+    def _within_tolerance(
+        values: np.ndarray,
+        targets: Any,
+        tolerance_pct: float
+    ) -> np.ndarray:
+        """Return a mask of values within tolerance_pct of their targets.
+        
+        Zero values never match, since the difference is relative to them.
+        """
+        # Computed in place in one scratch buffer: |v - t| / |v| * 100
+        with np.errstate(divide='ignore', invalid='ignore'):
+            diff_pct = np.subtract(values, targets)
+            np.abs(diff_pct, out=diff_pct)
+            np.divide(diff_pct, values, out=diff_pct)
+            np.abs(diff_pct, out=diff_pct)
+            np.multiply(diff_pct, 100, out=diff_pct)
+        
+        hits = np.less_equal(diff_pct, tolerance_pct)
+        hits &= values != 0
+        return hits
+    
+    def _windows(
+        self,
+        targets: np.ndarray,
+        tolerance_pct: float
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Return [start, stop) ranges of the sorted values that can match."""
+        sorted_values, _ = self._sorted_view()
+        frac = tolerance_pct / 100
+        
+        # |v - t| <= |v| * frac bounds v to [t/(1+frac), t/(1-frac)] (mirrored
+        # for negative t) when frac < 1; wider tolerances are unbounded.
+        if frac >= 1:
+            return (
+                np.zeros(len(targets), dtype=np.intp),
+                np.full(len(targets), len(sorted_values), dtype=np.intp),
+            )
+        
+        bound_a = targets / (1 + frac)
+        bound_b = targets / (1 - frac)
+        lo = np.minimum(bound_a, bound_b)
+        hi = np.maximum(bound_a, bound_b)
+        # Widen slightly so rounding never drops a boundary value; the exact
+        # check in _within_tolerance still decides. (Infinite targets give
+        # NaN bounds here, which is fine: they can never match.)
+        with np.errstate(invalid='ignore'):
+            lo -= np.abs(lo) * 1e-9
+            hi += np.abs(hi) * 1e-9
+        return (
+            np.searchsorted(sorted_values, lo, side='left'),
+            np.searchsorted(sorted_values, hi, side='right'),
+        )
     
     def find_exact(self, target: float) -> List[ResultValue]:
         """Find exact matches (within floating point tolerance)."""
-        key = round(target, 6)
-        return self.index.get(key, [])
+        return self.values_at(self._exact_positions(target))
+    
+    def find_matches_or_exact(
+        self,
+        target: float,
+        tolerance_pct: float = 1.0
+    ) -> List[ResultValue]:
+        """Return exact matches if there are any, else matches within tolerance."""
+        return self.find_exact(target) or self.find_matches(target, tolerance_pct)
 
 
 def load_results(dirpath: Path) -> ResultMatcher:
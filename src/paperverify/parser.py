@@ -1,7 +1,7 @@
 """LaTeX parser to extract numeric claims from paper files."""
 
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import List, Optional
 
@@ -16,6 +16,12 @@ class Claim:
     context: str  # Surrounding text for matching
     metric_hint: Optional[str] = None  # e.g., "MAE", "latency"
     model_hint: Optional[str] = None  # e.g., "XGBoost", "Chronos"
+    
+    # Shortened context shown in result tables
+    context_preview: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.context_preview = self.context[:30].strip()
 
 
 class LatexParser:
@@ -52,6 +58,18 @@ class LatexParser:
         r'timesfm',
     ]
     
+    # Lines without a digit cannot contain a claim
+    _HAS_DIGIT = re.compile(r'\d')
+    
+    # LaTeX commands whose lines never carry claims
+    _SKIP_RE = re.compile(
+        r'\\(?:usepackage|documentclass|bibliography|label\{|ref\{|cite)'
+    )
+    
+    # Numbers in running text, including K/M/B suffixes when standalone.
+    # The lookahead avoids capturing 'm' from 'ms', 'mb', etc.
+    _NUMBER_RE = re.compile(r'[\d,]+\.?\d*(?:[KMB](?![a-z]))?', re.IGNORECASE)
+    
     def __init__(self):
         # Compile regex patterns
         self.number_pattern = re.compile(
@@ -79,6 +97,10 @@ class LatexParser:
         lines = content.split('\n')
         
         for line_num, line in enumerate(lines, start=1):
+            # Skip prose, headings and environments without any numbers
+            if not self._HAS_DIGIT.search(line):
+                continue
+            
             # Skip comments
             if line.strip().startswith('%'):
                 continue
@@ -95,29 +117,25 @@ class LatexParser:
     
     def _is_non_claim_line(self, line: str) -> bool:
         """Check if line should be skipped (package imports, etc.)."""
-        skip_patterns = [
-            r'\\usepackage',
-            r'\\documentclass',
-            r'\\bibliography',
-            r'\\label{',
-            r'\\ref{',
-            r'\\cite',
-        ]
-        return any(re.search(p, line) for p in skip_patterns)
+        return self._SKIP_RE.search(line) is not None
     
     def _extract_claims_from_line(self, line: str, line_num: int) -> List[Claim]:
         """Extract all numeric claims from a single line."""
         claims = []
         
-        # Find all numbers in the line (including K/M/B suffixes when standalone)
-        # Use lookahead to avoid capturing 'm' from 'ms', 'mb', etc.
-        for match in re.finditer(r'[\d,]+\.?\d*(?:[KMB](?![a-z]))?', line, re.IGNORECASE):
+        # Find all numbers in the line
+        for match in self._NUMBER_RE.finditer(line):
             raw_text = match.group()
             
             # Skip very short numbers (likely page numbers, etc.)
             if len(raw_text) < 2 and '.' not in raw_text:
                 continue
             
+            # Skip years (e.g. "ImageNet 2012", "Smith et al., 2021")
+            year = raw_text.strip(',')
+            if len(year) == 4 and year.isdigit() and '1900' <= year <= '2100':
+                continue
+            
             # Parse the value
             try:
                 value = self._parse_number(raw_text)
@@ -152,7 +170,10 @@ class LatexParser:
     
     def _parse_number(self, raw_text: str) -> float:
         """Parse a number string, handling commas and K/M/B suffixes."""
-        cleaned = raw_text.replace(',', '').strip()
+        cleaned = raw_text.strip()
+        # Most numbers have no commas; skip the copy replace() would make
+        if ',' in cleaned:
+            cleaned = cleaned.replace(',', '')
         
         # Handle K/M/B suffixes (e.g., 98.5K, 1.2M, 710M)
         multipliers = {
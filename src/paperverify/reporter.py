@@ -1,15 +1,17 @@
 """Reporter to format verification results."""
 
+import math
 from pathlib import Path
-from typing import List, Optional
-
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich import box
+from typing import TYPE_CHECKING, List, Optional
 
 from .validator import VerificationResult, MatchStatus
 
+# rich is imported where terminal output is produced, so generating and
+# saving markdown reports does not pay its import cost.
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.text import Text
+
 
 class Reporter:
     """Format and output verification results."""
@@ -21,14 +23,64 @@ class Reporter:
         MatchStatus.UNVERIFIED: ("❓", "dim"),
     }
     
-    def __init__(self, console: Optional[Console] = None):
-        self.console = console or Console()
+    # STATUS_STYLES as a tuple indexed by status
+    _STYLES = tuple(map(STATUS_STYLES.__getitem__, MatchStatus))
+    
+    # Above this many rows, laying out a rich Table dominates run time, so
+    # rows are printed as pre-padded lines instead.
+    LARGE_TABLE_ROWS = 200
+    
+    # (most mismatches, panel style, message) for the summary panel
+    SUMMARY_TIERS = [
+        (0, "green", "All verified claims match! ✅"),
+        (2, "yellow", "Found {n} potential mismatch(es) ⚠️"),
+        (math.inf, "red", "Found {n} mismatches! ❌"),
+    ]
+    
+    # Line | Claim | Status | Matched Value | Source
+    MARKDOWN_ROW = "| %s | %s | %s | %s | %s |"
+    
+    def __init__(self, console: Optional["Console"] = None):
+        self._console = console
+    
+    @property
+    def console(self) -> "Console":
+        """Console for terminal output, created on first use."""
+        if self._console is None:
+            from rich.console import Console
+            self._console = Console()
+        return self._console
     
     def print_results(self, results: List[VerificationResult]):
-        """Print results to terminal with colors."""
+        """Print results to terminal with colors.
         
-        # Summary statistics
-        stats = self._calculate_stats(results)
+        When output is not a terminal or notebook (piped or redirected),
+        the styling would be discarded, so the markdown report is printed as
+        plain text instead.
+        """
+        if not self.console.is_terminal and not self.console.is_jupyter:
+            # Through the console, so recording and quiet mode still apply;
+            # soft wrapping keeps long table rows on one line
+            self.console.print(
+                self.generate_markdown(results),
+                markup=False, highlight=False, emoji=False, soft_wrap=True,
+            )
+            return
+        
+        from rich import box
+        from rich.panel import Panel
+        from rich.table import Table
+        from rich.text import Text
+        
+        # Count statuses in the same pass that builds the rows
+        counts = [0] * len(MatchStatus)
+        rows = []
+        for result in results:
+            counts[result.status] += 1
+            # Skip unverified for cleaner output
+            if result.status != MatchStatus.UNVERIFIED:
+                rows.append(self._row_cells(result))
+        stats = self._calculate_stats(counts)
         
         # Header
         self.console.print()
@@ -38,47 +90,86 @@ class Reporter:
         ))
         self.console.print()
         
-        # Results table
-        table = Table(box=box.ROUNDED, show_header=True)
-        table.add_column("Status", width=3)
-        table.add_column("Line", justify="right", width=5)
-        table.add_column("Claim", width=15)
-        table.add_column("Context", width=30)
-        table.add_column("Result", width=35)
-        
-        for result in results:
-            # Skip unverified for cleaner output
-            if result.status == MatchStatus.UNVERIFIED:
-                continue
-            
-            icon, style = self.STATUS_STYLES[result.status]
+        if len(rows) > self.LARGE_TABLE_ROWS:
+            self.console.print(self._plain_table(rows))
+        else:
+            # Results table
+            table = Table(box=box.ROUNDED, show_header=True)
+            table.add_column("Status", width=3)
+            table.add_column("Line", justify="right", width=5)
+            table.add_column("Claim", width=15)
+            table.add_column("Context", width=30)
+            table.add_column("Result", width=35)
             
-            claim_str = f"{result.claim.value}"
-            context = result.claim.context[:30].strip()
+            for icon, style, line, claim_str, context, result_str in rows:
+                table.add_row(
+                    icon,
+                    line,
+                    Text(claim_str, style=style),
+                    context,
+                    result_str,
+                )
             
-            if result.matched_value:
-                source = Path(result.matched_value.source_file).stem
-                result_str = f"{result.matched_value.value} ({source})"
-            else:
-                result_str = "-"
-            
-            table.add_row(
-                icon,
-                str(result.claim.line_number),
-                f"[{style}]{claim_str}[/]",
-                context,
-                result_str,
-            )
-        
-        self.console.print(table)
+            self.console.print(table)
         
         # Summary
         self.console.print()
         self._print_summary(stats)
     
+    def _row_cells(self, result: VerificationResult) -> tuple:
+        """Return (icon, style, line, claim, context, result) for a table row."""
+        icon, style = self._STYLES[result.status]
+        
+        claim_str = f"{result.claim.value}"
+        context = result.claim.context_preview
+        
+        if result.matched_value:
+            source = result.matched_value.source_stem
+            result_str = f"{result.matched_value.value} ({source})"
+        else:
+            result_str = "-"
+        
+        line = str(result.claim.line_number)
+        return icon, style, line, claim_str, context, result_str
+    
+    def _plain_table(self, rows: List[tuple]) -> "Text":
+        """Lay out table rows as padded text lines, styling only the claim."""
+        from rich.text import Text
+        
+        header = f"{'':3}{'Line':>5}  {'Claim':<15}  {'Context':<30}  Result"
+        lines = [Text(header, style="bold")]
+        for icon, style, line, claim_str, context, result_str in rows:
+            lines.append(Text.assemble(
+                f"{icon}  {line.rjust(5)}  ",
+                (claim_str.ljust(15), style),
+                f"  {context.ljust(30)}  {result_str}",
+            ))
+        return Text("\n").join(lines)
+    
     def generate_markdown(self, results: List[VerificationResult]) -> str:
         """Generate a markdown report."""
-        stats = self._calculate_stats(results)
+        counts = [0] * len(MatchStatus)
+        # Detail table columns, formatted into rows in one go below
+        line_numbers = []
+        claim_values = []
+        icons = []
+        matched = []
+        sources = []
+        for result in results:
+            counts[result.status] += 1
+            if result.status == MatchStatus.UNVERIFIED:
+                continue
+            
+            line_numbers.append(result.claim.line_number)
+            claim_values.append(result.claim.value)
+            icons.append(self._STYLES[result.status][0])
+            if result.matched_value:
+                matched.append(result.matched_value.value)
+                sources.append(result.matched_value.source_stem)
+            else:
+                matched.append("-")
+                sources.append("-")
+        stats = self._calculate_stats(counts)
         
         lines = [
             "# Paper Verification Report",
@@ -96,66 +187,48 @@ class Reporter:
             "| Line | Claim | Status | Matched Value | Source |",
             "|------|-------|--------|---------------|--------|",
         ]
-        
-        for result in results:
-            if result.status == MatchStatus.UNVERIFIED:
-                continue
-            
-            icon, _ = self.STATUS_STYLES[result.status]
-            
-            if result.matched_value:
-                source = Path(result.matched_value.source_file).stem
-                matched = f"{result.matched_value.value}"
-            else:
-                source = "-"
-                matched = "-"
-            
-            lines.append(
-                f"| {result.claim.line_number} | {result.claim.value} | "
-                f"{icon} | {matched} | {source} |"
-            )
+        row = self.MARKDOWN_ROW
+        lines.extend([
+            row % fields
+            for fields in zip(line_numbers, claim_values, icons, matched, sources)
+        ])
         
         return "\n".join(lines)
     
     def save_report(self, results: List[VerificationResult], filepath: Path):
-        """Save markdown report to file."""
+        """Save markdown report to file.
+        
+        An existing report with the same content is left untouched, so it
+        keeps its modification time across repeated runs.
+        """
         content = self.generate_markdown(results)
         filepath = Path(filepath)
+        try:
+            if filepath.read_text(encoding='utf-8') == content:
+                return
+        except (OSError, UnicodeDecodeError):
+            pass
         filepath.write_text(content, encoding='utf-8')
     
-    def _calculate_stats(self, results: List[VerificationResult]) -> dict:
-        """Calculate summary statistics."""
-        stats = {
-            'total': len(results),
-            'exact': 0,
-            'close': 0,
-            'mismatch': 0,
-            'unverified': 0,
+    def _calculate_stats(self, counts: List[int]) -> dict:
+        """Calculate summary statistics from per-status result counts."""
+        return {
+            'total': sum(counts),
+            'exact': counts[MatchStatus.EXACT_MATCH],
+            'close': counts[MatchStatus.CLOSE_MATCH],
+            'mismatch': counts[MatchStatus.MISMATCH],
+            'unverified': counts[MatchStatus.UNVERIFIED],
         }
-        
-        for r in results:
-            if r.status == MatchStatus.EXACT_MATCH:
-                stats['exact'] += 1
-            elif r.status == MatchStatus.CLOSE_MATCH:
-                stats['close'] += 1
-            elif r.status == MatchStatus.MISMATCH:
-                stats['mismatch'] += 1
-            else:
-                stats['unverified'] += 1
-        
-        return stats
     
     def _print_summary(self, stats: dict):
         """Print summary panel."""
-        if stats['mismatch'] == 0:
-            style = "green"
-            msg = "All verified claims match! ✅"
-        elif stats['mismatch'] <= 2:
-            style = "yellow"
-            msg = f"Found {stats['mismatch']} potential mismatch(es) ⚠️"
-        else:
-            style = "red"
-            msg = f"Found {stats['mismatch']} mismatches! ❌"
+        from rich.panel import Panel
+        
+        mismatches = stats['mismatch']
+        for max_mismatches, style, template in self.SUMMARY_TIERS:
+            if mismatches <= max_mismatches:
+                break
+        msg = template.format(n=mismatches)
         
         self.console.print(Panel(
             f"[bold]{msg}[/bold]\n\n"
@@ -1,19 +1,32 @@
 """Validator to compare paper claims against result values."""
 
 from dataclasses import dataclass
-from enum import Enum
+from enum import IntEnum
 from typing import List, Optional
 
+import numpy as np
+
 from .parser import Claim
 from .matcher import ResultMatcher, ResultValue
 
 
-class MatchStatus(Enum):
-    """Status of a claim verification."""
-    EXACT_MATCH = "exact"
-    CLOSE_MATCH = "close"
-    MISMATCH = "mismatch"
-    UNVERIFIED = "unverified"
+class MatchStatus(IntEnum):
+    """Status of a claim verification.
+    
+    Integer valued, so statuses can index arrays and compare as plain ints.
+    """
+    EXACT_MATCH = 0
+    CLOSE_MATCH = 1
+    MISMATCH = 2
+    UNVERIFIED = 3
+    
+    @property
+    def label(self) -> str:
+        """Short lowercase name, e.g. "exact"."""
+        return _STATUS_LABELS[self]
+
+
+_STATUS_LABELS = ("exact", "close", "mismatch", "unverified")
 
 
 @dataclass
@@ -41,58 +54,115 @@ class Validator:
         self.matcher = matcher
         self.tolerance_pct = tolerance_pct
     
+    # Candidates this far off are reported as mismatches
+    MISMATCH_PCT = 10.0
+    
     def verify_claim(self, claim: Claim) -> VerificationResult:
         """Verify a single claim against results."""
         
         # First, try exact match
         exact_matches = self.matcher.find_exact(claim.value)
         if exact_matches:
-            best_match = self._select_best_match(claim, exact_matches)
-            return VerificationResult(
-                claim=claim,
-                status=MatchStatus.EXACT_MATCH,
-                matched_value=best_match,
-                difference_pct=0.0,
-                message=f"Exact match in {best_match.source_file}",
-            )
+            return self._build_result(claim, MatchStatus.EXACT_MATCH, exact_matches)
+        
+        # Search once at the widest tolerance; the tighter tier is a subset
+        positions = self.matcher.find_positions(claim.value, self._search_pct())
+        return self._classify(claim, positions)
+    
+    def verify_all(self, claims: List[Claim]) -> List[VerificationResult]:
+        """Verify all claims.
+        
+        Same result as calling verify_claim on each claim, but claims without
+        an exact match are searched together in one vectorized pass.
+        """
+        results: List[Optional[VerificationResult]] = [None] * len(claims)
+        
+        # Claims without an exact match, as indices into claims
+        pending = []
+        for i, claim in enumerate(claims):
+            exact_matches = self.matcher.find_exact(claim.value)
+            if exact_matches:
+                results[i] = self._build_result(
+                    claim, MatchStatus.EXACT_MATCH, exact_matches
+                )
+            else:
+                pending.append(i)
         
-        # Try close match within tolerance
-        close_matches = self.matcher.find_matches(claim.value, self.tolerance_pct)
-        if close_matches:
-            best_match = self._select_best_match(claim, close_matches)
-            diff_pct = abs(best_match.value - claim.value) / abs(best_match.value) * 100
+        found = self.matcher.find_positions_batch(
+            [claims[i].value for i in pending], self._search_pct()
+        )
+        for i, positions in zip(pending, found):
+            results[i] = self._classify(claims[i], positions)
+        
+        return results
+    
+    def _search_pct(self) -> float:
+        """Tolerance that covers both the close and the mismatch tier."""
+        return max(self.tolerance_pct, self.MISMATCH_PCT)
+    
+    def _classify(
+        self,
+        claim: Claim,
+        positions: np.ndarray
+    ) -> VerificationResult:
+        """Build the result for a claim without exact matches.
+        
+        positions are the matcher positions found at _search_pct(). Those
+        within tolerance_pct make a close match; otherwise all of them (each
+        within MISMATCH_PCT then) make a mismatch. ResultValues are only
+        built for the tier that is reported.
+        """
+        if not len(positions):
+            # No match found
+            return self._build_result(claim, MatchStatus.UNVERIFIED, [])
+        
+        values = self.matcher.value_array[positions]
+        diff_pct = np.abs(values - claim.value) / np.abs(values) * 100
+        close = diff_pct <= self.tolerance_pct
+        if close.any():
+            close_matches = self.matcher.values_at(positions[close])
+            return self._build_result(claim, MatchStatus.CLOSE_MATCH, close_matches)
+        
+        wide_matches = self.matcher.values_at(positions)
+        return self._build_result(claim, MatchStatus.MISMATCH, wide_matches)
+    
+    def _build_result(
+        self,
+        claim: Claim,
+        status: MatchStatus,
+        matches: List[ResultValue]
+    ) -> VerificationResult:
+        """Build the result for a claim from the matches of its status tier."""
+        if status == MatchStatus.UNVERIFIED:
             return VerificationResult(
                 claim=claim,
-                status=MatchStatus.CLOSE_MATCH,
-                matched_value=best_match,
-                difference_pct=diff_pct,
-                message=f"Close match ({diff_pct:.1f}% diff) in {best_match.source_file}",
+                status=status,
+                message="No matching value found in results",
             )
         
-        # Try wider tolerance (5%) to find potential mismatches
-        wide_matches = self.matcher.find_matches(claim.value, 10.0)
-        if wide_matches:
-            best_match = self._select_best_match(claim, wide_matches)
-            diff_pct = abs(best_match.value - claim.value) / abs(best_match.value) * 100
+        best_match = self._select_best_match(claim, matches)
+        if status == MatchStatus.EXACT_MATCH:
             return VerificationResult(
                 claim=claim,
-                status=MatchStatus.MISMATCH,
+                status=status,
                 matched_value=best_match,
-                difference_pct=diff_pct,
-                message=f"Mismatch! Actual value is {best_match.value} ({diff_pct:.1f}% diff)",
+                difference_pct=0.0,
+                message=f"Exact match in {best_match.source_file}",
             )
         
-        # No match found
+        diff_pct = abs(best_match.value - claim.value) / abs(best_match.value) * 100
+        if status == MatchStatus.CLOSE_MATCH:
+            message = f"Close match ({diff_pct:.1f}% diff) in {best_match.source_file}"
+        else:
+            message = f"Mismatch! Actual value is {best_match.value} ({diff_pct:.1f}% diff)"
         return VerificationResult(
             claim=claim,
-            status=MatchStatus.UNVERIFIED,
-            message="No matching value found in results",
+            status=status,
+            matched_value=best_match,
+            difference_pct=diff_pct,
+            message=message,
         )
     
-    def verify_all(self, claims: List[Claim]) -> List[VerificationResult]:
-        """Verify all claims."""
-        return [self.verify_claim(c) for c in claims]
-    
     def _select_best_match(
         self, 
         claim: Claim, 
@@ -102,32 +172,34 @@ class Validator:
         if len(matches) == 1:
             return matches[0]
         
-        # Score matches based on context alignment
-        scored = []
+        # Score matches based on context alignment, on lowercased keys
+        # cached on each value
+        metric_hint = claim.metric_hint.lower() if claim.metric_hint else None
+        model_hint = claim.model_hint.lower() if claim.model_hint else None
+        
+        best_match, best_score = matches[0], -1
         for match in matches:
             score = 0
             
             # Metric match
-            if claim.metric_hint and match.metric:
-                if claim.metric_hint.lower() == match.metric.lower():
-                    score += 10
+            if metric_hint and match.metric_lower == metric_hint:
+                score += 10
             
             # Model match
-            if claim.model_hint and match.model:
-                if claim.model_hint.lower() in match.model.lower():
-                    score += 10
-                elif match.model.lower() in claim.model_hint.lower():
+            model = match.model_lower
+            if model_hint and model:
+                if model_hint in model or model in model_hint:
                     score += 10
             
             # Path contains relevant keywords
-            if claim.metric_hint and claim.metric_hint.lower() in match.path.lower():
+            if metric_hint and metric_hint in match.path_lower:
                 score += 5
             
-            scored.append((score, match))
+            # Highest score wins; the first one on ties
+            if score > best_score:
+                best_match, best_score = match, score
         
-        # Return highest scored match
-        scored.sort(key=lambda x: x[0], reverse=True)
-        return scored[0][1]
+        return best_match
 
 
 def verify_paper(
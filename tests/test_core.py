@@ -1,5 +1,6 @@
 """Tests for paper-verify."""
 
+import os
 import pytest
 from pathlib import Path
 from paperverify.parser import LatexParser, Claim
@@ -39,6 +40,14 @@ class TestLatexParser:
         values = [c.value for c in claims]
         assert 1200000.0 in values
     
+    def test_skip_years(self):
+        parser = LatexParser()
+        claims = parser.parse_content("Trained on ImageNet 2012, reaching 2.44 MAE.")
+        
+        values = [c.value for c in claims]
+        assert 2012.0 not in values
+        assert 2.44 in values
+    
     def test_identify_metric_mae(self):
         parser = LatexParser()
         claims = parser.parse_content("Achieves MAE of 2.10 on ETTh1.")
@@ -69,12 +78,11 @@ class TestResultMatcher:
         matcher = ResultMatcher()
         # Manually add a value
         from paperverify.matcher import ResultValue
-        matcher.values.append(ResultValue(
+        matcher.add_values([ResultValue(
             value=2.44,
             source_file="test.json",
             path="metrics.mae",
-        ))
-        matcher._build_index()
+        )])
         
         matches = matcher.find_exact(2.44)
         assert len(matches) == 1
@@ -83,16 +91,225 @@ class TestResultMatcher:
     def test_find_close_match(self):
         matcher = ResultMatcher()
         from paperverify.matcher import ResultValue
-        matcher.values.append(ResultValue(
+        matcher.add_values([ResultValue(
             value=2.4404,
             source_file="test.json",
             path="metrics.mae",
-        ))
-        matcher._build_index()
+        )])
         
         # 2.44 vs 2.4404 = 0.016% difference
         matches = matcher.find_matches(2.44, tolerance_pct=1.0)
         assert len(matches) == 1
+    
+    def test_find_matches_or_exact_prefers_exact(self):
+        matcher = ResultMatcher()
+        from paperverify.matcher import ResultValue
+        matcher.add_values(
+            ResultValue(value=value, source_file="test.json", path="metrics.mae")
+            for value in (2.44, 2.4404)
+        )
+        
+        assert [m.value for m in matcher.find_matches_or_exact(2.44)] == [2.44]
+        assert len(matcher.find_matches_or_exact(2.4402)) == 2
+        assert [m.value for m in matcher.find_matches(2.44, 0)] == [2.44]
+    
+    def test_add_values_after_search(self):
+        matcher = ResultMatcher()
+        from paperverify.matcher import ResultValue
+        matcher.add_values([
+            ResultValue(value=5.0, source_file="a.json", path="mae"),
+            ResultValue(value=2.44, source_file="a.json", path="rmse"),
+        ])
+        assert [m.path for m in matcher.find_matches(2.44)] == ["rmse"]
+        
+        matcher.add_values([
+            ResultValue(value=2.4404, source_file="b.json", path="mae"),
+        ])
+        assert len(matcher) == 3
+        assert [m.source_file for m in matcher.find_matches(2.44)] == [
+            "a.json", "b.json",
+        ]
+        assert [m.path for m in matcher.find_exact(2.4404)] == ["mae"]
+        
+        with pytest.raises(AttributeError):
+            matcher.values.append(
+                ResultValue(value=1.0, source_file="c.json", path="mae")
+            )
+    
+    def test_find_matches_batch_matches_single_searches(self):
+        matcher = ResultMatcher()
+        from paperverify.matcher import ResultValue
+        numbers = [2.44, 2.4404, 0.0, -3.1, -3.12, 100.0, 95.0, 2.44, 1e-7]
+        matcher.add_values(
+            ResultValue(value=value, source_file="r.json", path=f"v{i}")
+            for i, value in enumerate(numbers)
+        )
+        targets = [2.44, 0.0, -3.11, float("inf"), -float("inf"), 98.0, 5e6]
+        
+        assert matcher.find_matches_batch([], 1.0) == []
+        for tolerance_pct in (0, -1, 0.5, 1.0, 10.0, 100.0, 250.0):
+            assert matcher.find_matches_batch(targets, tolerance_pct) == [
+                matcher.find_matches(target, tolerance_pct) for target in targets
+            ]
+        assert ResultMatcher().find_matches_batch(targets, 1.0) == [[]] * len(targets)
+        
+        # Split batches and one-by-one searches of wide windows agree too
+        matcher.BATCH_WINDOW_VALUES = 2
+        matcher.MAX_BATCH_CANDIDATES = 3
+        for tolerance_pct in (0.5, 10.0, 250.0):
+            assert matcher.find_matches_batch(targets, tolerance_pct) == [
+                matcher.find_matches(target, tolerance_pct) for target in targets
+            ]
+    
+    def test_load_directory_nested(self, tmp_path):
+        (tmp_path / "runs").mkdir()
+        (tmp_path / "runs" / "xgboost_etth1.json").write_text('{"mae": 2.44}')
+        (tmp_path / "summary.CSV").write_text("model,rmse\nxgboost,3.1\n")
+        (tmp_path / "notes.txt").write_text("1.5")
+        
+        matcher = ResultMatcher()
+        assert matcher.load_directory(tmp_path) == 2
+        
+        by_value = {v.value: v for v in matcher.values}
+        assert by_value[2.44].model == "xgboost"
+        assert by_value[2.44].dataset == "etth1"
+        assert by_value[3.1].metric == "rmse"
+        assert 1.5 not in by_value
+    
+    def test_streamed_json_matches_in_memory_load(self, tmp_path):
+        json_file = tmp_path / "xgboost_etth1.json"
+        json_file.write_text(
+            '{"metrics": {"mae": 2.44, "ok": true, "name": "x", "none": null},'
+            ' "runs": [[1, 2], {"rmse": 3.1}, [%s]], "big": [%s]}'
+            % (",".join(["7"] * 101), ",".join(["5"] * 101))
+        )
+        
+        def load(stream_bytes):
+            matcher = ResultMatcher()
+            matcher.STREAM_JSON_BYTES = stream_bytes
+            return [
+                (v.value, v.path, v.model, v.dataset, v.metric)
+                for v in matcher._load_json_file(json_file)
+            ]
+        
+        assert load(stream_bytes=0) == load(stream_bytes=10**9)
+    
+    def test_streamed_json_falls_back_on_nan_and_wide_ints(self, tmp_path):
+        json_file = tmp_path / "results.json"
+        json_file.write_text(
+            '{"mae": 2.44, "rmse": NaN, "steps": 123456789012345678901234567890}'
+        )
+        
+        matcher = ResultMatcher()
+        matcher.STREAM_JSON_BYTES = 0
+        values = {v.path: v.value for v in matcher._load_json_file(json_file)}
+        
+        assert values["mae"] == 2.44
+        assert values["rmse"] != values["rmse"]  # NaN
+        assert values["steps"] == 1.2345678901234568e29
+    
+    def test_load_sqlite_numeric_columns(self, tmp_path):
+        import sqlite3
+        
+        db_file = tmp_path / "results.db"
+        conn = sqlite3.connect(db_file)
+        conn.execute('CREATE TABLE "run stats" (name TEXT, mae REAL, extra)')
+        conn.executemany(
+            'INSERT INTO "run stats" VALUES (?, ?, ?)',
+            [("xgboost", 2.44, "n/a"), ("42", None, 7)],
+        )
+        conn.commit()
+        conn.close()
+        
+        values = ResultMatcher()._load_sqlite_file(db_file)
+        
+        assert [(v.value, v.path, v.metric) for v in values] == [
+            (2.44, "run stats.mae.row0", "mae"),
+            (7.0, "run stats.extra.row1", None),
+        ]
+    
+    def test_load_excel_skips_booleans(self, tmp_path):
+        import openpyxl
+        
+        xlsx_file = tmp_path / "results.xlsx"
+        wb = openpyxl.Workbook()
+        wb.active.append(["mae", 2.44, True, 3])
+        wb.save(xlsx_file)
+        
+        values = ResultMatcher()._load_excel_file(xlsx_file)
+        
+        assert [v.value for v in values] == [2.44, 3.0]
+    
+    def test_load_csv_skips_text_and_booleans(self, tmp_path):
+        csv_file = tmp_path / "results.csv"
+        csv_file.write_text("name,mae,ok\nxgboost,2.44,True\narima,n/a,False\n")
+        
+        values = ResultMatcher()._load_csv_file(csv_file)
+        
+        assert [(v.value, v.path, v.metric) for v in values] == [
+            (2.44, "row_0.mae", "mae"),
+        ]
+    
+    def test_load_pdf_table(self):
+        pdf_file = Path(__file__).parent / "fixtures" / "results_table.pdf"
+        
+        values = ResultMatcher()._load_pdf_file(pdf_file)
+        
+        # Header row names the columns; zero, empty and text cells are skipped
+        assert [(v.value, v.path, v.metric) for v in values] == [
+            (2.44, "table0.mae.row0", "mae"),
+            (3102.0, "table0.latency.row0", "latency"),
+            (7.0, "table0.Unnamed: 2.row1", None),
+            (1234.5, "table0.latency.row1", "latency"),
+        ]
+    
+    def test_load_pdf_borderless_tables(self):
+        fixtures = Path(__file__).parent / "fixtures"
+        matcher = ResultMatcher()
+        
+        # Booktabs-style rules and whitespace-only layouts have no cell borders
+        booktabs = matcher._load_pdf_file(fixtures / "results_booktabs.pdf")
+        plain = matcher._load_pdf_file(fixtures / "results_plain.pdf")
+        
+        assert [(v.value, v.path) for v in booktabs] == [
+            (2.44, "table0.mae.row0"),
+            (3.1, "table0.rmse.row0"),
+            (3102.0, "table0.latency.row0"),
+            (2.61, "table0.mae.row1"),
+            (1234.5, "table0.latency.row1"),
+        ]
+        assert [(v.value, v.path) for v in plain] == [
+            (12.5, "table0.smape.row0"),
+            (1024.0, "table0.vram.row0"),
+            (2048.0, "table0.vram.row1"),
+        ]
+    
+    def test_load_csv_trailing_comma_keeps_headers(self, tmp_path):
+        csv_file = tmp_path / "results.csv"
+        csv_file.write_text("epoch,mae,rmse\n1,2.44,3.1,\n2,2.5\n")
+        
+        values = ResultMatcher()._load_csv_file(csv_file)
+        
+        assert [(v.value, v.path, v.metric) for v in values] == [
+            (1.0, "row_0.epoch", None),
+            (2.44, "row_0.mae", "mae"),
+            (3.1, "row_0.rmse", "rmse"),
+            (2.0, "row_1.epoch", None),
+            (2.5, "row_1.mae", "mae"),
+        ]
+    
+    def test_load_csv_duplicate_and_empty_headers(self, tmp_path):
+        csv_file = tmp_path / "results.csv"
+        csv_file.write_text("mae,mae,,x\n1,2,3,4\n")
+        
+        values = ResultMatcher()._load_csv_file(csv_file)
+        
+        # Like csv.DictReader: a repeated name keeps its last column's value
+        assert [(v.value, v.path) for v in values] == [
+            (2.0, "row_0.mae"),
+            (3.0, "row_0."),
+            (4.0, "row_0.x"),
+        ]
 
 
 class TestValidator:
@@ -101,12 +318,11 @@ class TestValidator:
     def test_exact_match_status(self):
         matcher = ResultMatcher()
         from paperverify.matcher import ResultValue
-        matcher.values.append(ResultValue(
+        matcher.add_values([ResultValue(
             value=2.44,
             source_file="test.json",
             path="metrics.mae",
-        ))
-        matcher._build_index()
+        )])
         
         validator = Validator(matcher)
         claim = Claim(
@@ -122,12 +338,11 @@ class TestValidator:
     def test_close_match_status(self):
         matcher = ResultMatcher()
         from paperverify.matcher import ResultValue
-        matcher.values.append(ResultValue(
+        matcher.add_values([ResultValue(
             value=2.4404,
             source_file="test.json",
             path="metrics.mae",
-        ))
-        matcher._build_index()
+        )])
         
         validator = Validator(matcher, tolerance_pct=1.0)
         claim = Claim(
@@ -139,6 +354,137 @@ class TestValidator:
         
         result = validator.verify_claim(claim)
         assert result.status == MatchStatus.CLOSE_MATCH
+    
+    def test_verify_all_matches_verify_claim(self):
+        matcher = ResultMatcher()
+        from paperverify.matcher import ResultValue
+        matcher.add_values([
+            ResultValue(value=2.44, source_file="a.json", path="mae"),
+            ResultValue(value=3.1, source_file="a.json", path="rmse"),
+            ResultValue(value=3.102, source_file="b.json", path="rmse"),
+            ResultValue(value=12.0, source_file="b.json", path="latency"),
+        ])
+        claims = [
+            Claim(value=value, raw_text=str(value), line_number=i, context="")
+            for i, value in enumerate([2.44, 3.11, 12.5, 60.0, 3.1, -2.44])
+        ]
+        
+        validator = Validator(matcher, tolerance_pct=1.0)
+        results = validator.verify_all(claims)
+        
+        assert results == [validator.verify_claim(claim) for claim in claims]
+        assert [r.status for r in results] == [
+            MatchStatus.EXACT_MATCH,
+            MatchStatus.CLOSE_MATCH,
+            MatchStatus.MISMATCH,
+            MatchStatus.UNVERIFIED,
+            MatchStatus.EXACT_MATCH,
+            MatchStatus.UNVERIFIED,
+        ]
+    
+    def test_best_match_prefers_context(self):
+        from paperverify.matcher import ResultValue
+        matches = [
+            ResultValue(value=2.44, source_file="a.json", path="runs.rmse"),
+            ResultValue(value=2.44, source_file="b.json", path="runs.mae",
+                        model="arima", metric="mae"),
+            ResultValue(value=2.44, source_file="c.json", path="runs.MAE",
+                        model="XGBoost-large", metric="MAE"),
+            ResultValue(value=2.44, source_file="d.json", path="runs.mae",
+                        model="xgboost", metric="mae"),
+        ]
+        validator = Validator(ResultMatcher())
+        claim = Claim(value=2.44, raw_text="2.44", line_number=1, context="",
+                      metric_hint="mae", model_hint="XGBoost")
+        
+        # c and d both score 25; the first one wins
+        assert validator._select_best_match(claim, matches).source_file == "c.json"
+        
+        no_hints = Claim(value=2.44, raw_text="2.44", line_number=1, context="")
+        assert validator._select_best_match(no_hints, matches).source_file == "a.json"
+
+
+
+class TestReporter:
+    """Tests for reporter."""
+    
+    @staticmethod
+    def _results(count):
+        from paperverify.matcher import ResultValue
+        from paperverify.validator import VerificationResult
+        results = []
+        for i in range(count):
+            claim = Claim(value=2.44, raw_text="2.44", line_number=i + 1,
+                          context="MAE of [b]2.44[/b] on ETTh1")
+            results.append(VerificationResult(
+                claim=claim,
+                status=MatchStatus.EXACT_MATCH,
+                matched_value=ResultValue(value=2.44, source_file="runs/xgb.json",
+                                          path="mae"),
+            ))
+        unverified = Claim(value=7.0, raw_text="7", line_number=99, context="")
+        results.append(VerificationResult(claim=unverified,
+                                          status=MatchStatus.UNVERIFIED))
+        return results
+    
+    def test_print_results_writes_markdown_when_not_a_terminal(self):
+        import io
+        from rich.console import Console
+        from paperverify.reporter import Reporter
+        results = self._results(2)
+        out = io.StringIO()
+        console = Console(file=out, width=40, record=True)
+        reporter = Reporter(console)
+        
+        reporter.print_results(results)
+        
+        # Long rows are not wrapped, and the console still records the output
+        assert out.getvalue() == reporter.generate_markdown(results) + "\n"
+        assert "| 1 | 2.44 | ✅ | 2.44 | xgb |" in out.getvalue()
+        assert "- **Unverified**: 1" in out.getvalue()
+        assert console.export_text() == out.getvalue()
+        
+        quiet = io.StringIO()
+        Reporter(Console(file=quiet, quiet=True)).print_results(results)
+        assert quiet.getvalue() == ""
+    
+    def test_print_results_pads_large_tables(self):
+        import io
+        from rich.console import Console
+        from paperverify.reporter import Reporter
+        out = io.StringIO()
+        console = Console(file=out, force_terminal=True, color_system=None, width=120)
+        
+        Reporter(console).print_results(self._results(Reporter.LARGE_TABLE_ROWS + 1))
+        
+        lines = out.getvalue().splitlines()
+        rows = [line for line in lines if line.startswith("✅")]
+        assert len(rows) == Reporter.LARGE_TABLE_ROWS + 1
+        assert not any(line.startswith("│ ✅") for line in lines)
+        # Context is printed as-is, not parsed as markup
+        assert rows[0] == (
+            "✅      1  " + "2.44".ljust(15) + "  "
+            + "MAE of [b]2.44[/b] on ETTh1".ljust(30) + "  2.44 (xgb)"
+        )
+        assert "Checked: 202 | Exact: 201" in out.getvalue()
+    
+    def test_save_report_skips_unchanged(self, tmp_path):
+        from paperverify.reporter import Reporter
+        from paperverify.validator import VerificationResult
+        claim = Claim(value=2.44, raw_text="2.44", line_number=1, context="")
+        results = [VerificationResult(claim=claim, status=MatchStatus.UNVERIFIED)]
+        report = tmp_path / "report.md"
+        reporter = Reporter()
+        
+        reporter.save_report(results, report)
+        os.utime(report, (0, 0))
+        reporter.save_report(results, report)
+        assert report.stat().st_mtime == 0
+        
+        results[0].status = MatchStatus.MISMATCH
+        reporter.save_report(results, report)
+        assert report.stat().st_mtime != 0
+        assert "| 1 | 2.44 | ❌ | - | - |" in report.read_text(encoding="utf-8")
 
 
 if __name__ == "__main__":